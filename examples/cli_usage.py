@@ -7,15 +7,26 @@ for encoding and decoding data. It shows the complete workflow from
 input to output and back.
 """
 
-import subprocess
+import io
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from typing import Tuple
 
+from splurge_base58.cli import main as cli_main
+
+
+_BANNER = "=" * 50
+
 
 def run_cli_command(command: str, input_data: str) -> Tuple[int, str, str]:
     """
     Run a splurge_base58 CLI command and capture the output.
     
+    The CLI entry point is invoked in-process, so the demonstrations do not
+    pay interpreter startup for every call. Output capture swaps the
+    process-wide ``sys.stdout``/``sys.stderr``, so calls must be made
+    serially rather than from worker threads.
+    
     Args:
         command: The CLI command to run ('encode' or 'decode')
         input_data: The input data for the command
@@ -23,18 +34,20 @@ def run_cli_command(command: str, input_data: str) -> Tuple[int, str, str]:
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
     try:
-        result = subprocess.run(
-            [sys.executable, '-m', 'splurge_base58', command, input_data],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
-    except subprocess.TimeoutExpired:
-        return 1, "", "Command timed out"
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            cli_main([command, input_data])
+        return_code = 0
+    except SystemExit as e:
+        return_code = e.code if isinstance(e.code, int) else 1
     except Exception as e:
         return 1, "", str(e)
+    # Decoded binary output carries non-UTF-8 bytes as surrogate escapes;
+    # replace them so the result can be printed on any console
+    output = stdout.getvalue().encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+    return return_code, output.strip(), stderr.getvalue().strip()
 
 
 def demonstrate_encode_workflow() -> None:
@@ -159,8 +172,13 @@ def demonstrate_length_constraints() -> None:
 
 def main() -> None:
     """Main function to run all demonstrations."""
+    # The demonstrations emit many short lines; block-buffer them instead of
+    # flushing stdout on every newline.
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("splurge_base58 CLI End-to-End Workflow Examples")
-    print("=" * 50)
+    print(_BANNER)
     
     try:
         demonstrate_encode_workflow()
@@ -168,7 +186,7 @@ def main() -> None:
         demonstrate_error_handling()
         demonstrate_length_constraints()
         
-        print("\n" + "=" * 50)
+        print("\n" + _BANNER)
         print("All demonstrations completed!")
         
     except KeyboardInterrupt:
@@ -6,7 +6,28 @@ This allows the package to be run as:
     python -m splurge_base58 decode <input>
 """
 
-from splurge_base58.cli import main
+import io
+import sys
+from typing import NoReturn
+
+from splurge_base58.cli import main as cli_main
+
+
+def main() -> NoReturn:
+    """
+    Console entry point: set up standard I/O and run the CLI.
+    
+    Text I/O uses UTF-8 regardless of the console's code page, passing
+    undecodable bytes through unchanged.
+    
+    Raises:
+        SystemExit: Always exits with appropriate status code
+    """
+    for stream in (sys.stdin, sys.stdout):
+        if isinstance(stream, io.TextIOWrapper):
+            stream.reconfigure(encoding="utf-8", errors="surrogateescape")
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
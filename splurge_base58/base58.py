@@ -6,6 +6,18 @@ Copyright (c) 2025 Jim Schilling
 This module is licensed under the MIT License.
 """
 
+import math
+from typing import Final
+
+
+# Maximum input length, in characters, accepted by the CLI encode command.
+# Base58.encode itself does not limit its input length.
+MAX_ENCODE_INPUT_LENGTH: Final = 2048
+# Each input byte expands to at most log(256)/log(58) base-58 characters
+# (leading zero bytes map to a single '1'), so this bounds any valid encoding
+# of MAX_ENCODE_INPUT_LENGTH bytes (e.g. ASCII input at the encode limit).
+MAX_DECODE_INPUT_LENGTH: Final = math.ceil(MAX_ENCODE_INPUT_LENGTH * math.log(256) / math.log(58))
+
 
 class Base58Error(Exception):
     """Base class for all base-58 errors."""
@@ -7,42 +7,86 @@ and decoding base-58 strings back to binary data.
 """
 
 import sys
-from typing import NoReturn
+from typing import Callable, Dict, List, NoReturn, Optional, Type
 
-from splurge_base58.base58 import Base58, Base58Error
+from splurge_base58.base58 import (
+    MAX_DECODE_INPUT_LENGTH,
+    MAX_ENCODE_INPUT_LENGTH,
+    Base58,
+    Base58Error,
+)
 
 
-_MAX_ENCODE_INPUT_LENGTH = 2048
+# Characters read from stdin for "-" input: enough for the largest command limit,
+# a trailing newline, and one more so oversize input still fails the length check
+_MAX_STDIN_READ = max(MAX_ENCODE_INPUT_LENGTH, MAX_DECODE_INPUT_LENGTH) + 2
 
+_USAGE_TEXT = f"""\
+Usage:
+  python -m splurge_base58 encode <INPUT>
+  python -m splurge_base58 decode <INPUT>
 
-def _get_max_decode_input_length() -> int:
+Commands:
+  encode    Encode binary data to base-58 string
+  decode    Decode base-58 string to binary data
+
+Input:
+  Pass - as <INPUT> to read it from standard input
+
+Constraints:
+  encode: max input length is {MAX_ENCODE_INPUT_LENGTH} characters
+  decode: max input length is {MAX_DECODE_INPUT_LENGTH} characters
+"""
+
+
+def _die(message: str) -> NoReturn:
     """
-    Calculate the maximum decode input length based on the maximum encode input length.
+    Report a fatal error and exit.
     
-    This is calculated lazily to avoid circular dependencies during module import.
+    Args:
+        message: Error message to write to stdout
+        
+    Raises:
+        SystemExit: Always exits with status 1
+    """
+    print(message)
+    sys.exit(1)
+
+
+def _write_output(data: bytes) -> None:
+    """
+    Write a command result to stdout as a line.
     
-    Returns:
-        Maximum length for decode input in characters
+    The bytes go straight to the binary buffer when stdout has one; otherwise
+    (e.g. stdout redirected to io.StringIO) they are written through the text
+    layer, with non-UTF-8 bytes carried as surrogate escapes. Nothing is
+    written when there is no stdout at all (e.g. under pythonw).
+    
+    Args:
+        data: Result bytes to write
     """
-    return len(Base58.encode(b'a' * _MAX_ENCODE_INPUT_LENGTH))
+    if sys.stdout is None:
+        return
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        # Keep ordering with anything already written through the text layer
+        sys.stdout.flush()
+        buffer.write(data + b"\n")
+    else:
+        sys.stdout.write(data.decode("utf-8", "surrogateescape") + "\n")
 
 
 def print_usage() -> None:
     """Print usage information for the CLI."""
-    print("Usage:")
-    print("  python -m splurge_base58 encode <INPUT>")
-    print("  python -m splurge_base58 decode <INPUT>")
-    print()
-    print("Commands:")
-    print("  encode    Encode binary data to base-58 string")
-    print("  decode    Decode base-58 string to binary data")
-    print()
-    print("Constraints:")
-    print(f"  encode: max input length is {_MAX_ENCODE_INPUT_LENGTH} bytes")
-    print(f"  decode: max input length is {_get_max_decode_input_length()} characters")
-
-
-def encode_command(input_data: str) -> None:
+    print(_USAGE_TEXT, end="")
+
+
+def encode_command(
+    input_data: str,
+    *,
+    _encode: Callable[[bytes], str] = Base58.encode,
+    _error: Type[Base58Error] = Base58Error,
+) -> None:
     """
     Handle the encode command.
     
@@ -52,24 +96,26 @@ def encode_command(input_data: str) -> None:
     Raises:
         SystemExit: If input is too long or encoding fails
     """
-    if len(input_data) > _MAX_ENCODE_INPUT_LENGTH:
-        print(f"Error: Input length {len(input_data)} exceeds maximum of {_MAX_ENCODE_INPUT_LENGTH}")
-        sys.exit(1)
+    if len(input_data) > MAX_ENCODE_INPUT_LENGTH:
+        _die(f"Error: Input length {len(input_data)} exceeds maximum of {MAX_ENCODE_INPUT_LENGTH}")
     
     try:
-        # Convert string input to bytes
-        data = input_data.encode('utf-8')
-        encoded = Base58.encode(data)
-        print(encoded)
+        # Convert string input to bytes (ASCII is a cheaper subset of UTF-8)
+        data = input_data.encode('ascii') if input_data.isascii() else input_data.encode('utf-8')
+        encoded = _encode(data)
+        _write_output(encoded.encode('ascii'))
     except UnicodeEncodeError as e:
-        print(f"Error: Cannot encode input as UTF-8: {e}")
-        sys.exit(1)
-    except Base58Error as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        _die(f"Error: Cannot encode input as UTF-8: {e}")
+    except _error as e:
+        _die(f"Error: {e}")
 
 
-def decode_command(input_data: str) -> None:
+def decode_command(
+    input_data: str,
+    *,
+    _decode: Callable[[str], bytes] = Base58.decode,
+    _error: Type[Base58Error] = Base58Error,
+) -> None:
     """
     Handle the decode command.
     
@@ -79,48 +125,56 @@ def decode_command(input_data: str) -> None:
     Raises:
         SystemExit: If input is too long or decoding fails
     """
-    max_decode_length = _get_max_decode_input_length()
-    if len(input_data) > max_decode_length:
-        print(f"Error: Input length {len(input_data)} exceeds maximum of {max_decode_length}")
-        sys.exit(1)
+    if len(input_data) > MAX_DECODE_INPUT_LENGTH:
+        _die(f"Error: Input length {len(input_data)} exceeds maximum of {MAX_DECODE_INPUT_LENGTH}")
     
     try:
-        decoded = Base58.decode(input_data)
-        # Convert bytes back to string for display
-        result = decoded.decode('utf-8')
-        print(result)
-    except Base58Error as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except UnicodeDecodeError:
-        print("Error: Decoded data is not valid UTF-8")
-        sys.exit(1)
+        decoded = _decode(input_data)
+        # Write the decoded bytes as-is; they need not be valid UTF-8
+        _write_output(decoded)
+    except _error as e:
+        _die(f"Error: {e}")
 
 
-def main() -> NoReturn:
+_COMMANDS: Dict[str, Callable[[str], None]] = {
+    "encode": encode_command,
+    "decode": decode_command,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> NoReturn:
     """
     Main CLI entry point.
     
+    Args:
+        argv: Command-line arguments without the program name (defaults to sys.argv[1:])
+        
     Raises:
         SystemExit: Always exits with appropriate status code
     """
-    if len(sys.argv) < 3:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2:
         print_usage()
         sys.exit(1)
     
-    command = sys.argv[1].lower()
-    input_data = sys.argv[2]
+    command = args[0]
+    input_data = args[1]
     
-    if command == "encode":
-        encode_command(input_data)
-        sys.exit(0)
-    elif command == "decode":
-        decode_command(input_data)
-        sys.exit(0)
-    else:
-        print(f"Error: Unknown command '{command}'")
+    # Commands are almost always given in lowercase; only fold case on a miss
+    handler = _COMMANDS.get(command) or _COMMANDS.get(command.lower())
+    if handler is None:
+        print(f"Error: Unknown command '{command.lower()}'")
         print_usage()
         sys.exit(1)
+    
+    if input_data == "-":
+        if sys.stdin is None:
+            _die("Error: Standard input is not available")
+        # Read the input from stdin, dropping the newline a shell pipe adds
+        input_data = sys.stdin.read(_MAX_STDIN_READ).removesuffix("\n")
+    
+    handler(input_data)
+    sys.exit(0)
 
 
 if __name__ == "__main__":
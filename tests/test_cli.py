@@ -1,50 +1,123 @@
 """
 Tests for CLI functionality.
 
-This module contains comprehensive tests for the CLI interface
-using subprocess calls to test actual CLI behavior.
+This module contains comprehensive tests for the CLI interface.
+Commands are run in-process through the CLI entry point; a few subprocess
+tests cover the ``python -m splurge_base58`` wiring.
 """
 
+import io
+import random
+import string
 import subprocess
 import sys
-from typing import Tuple
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import List, Tuple
 
 import pytest
 
-from splurge_base58.base58 import Base58
+from splurge_base58.base58 import MAX_DECODE_INPUT_LENGTH, MAX_ENCODE_INPUT_LENGTH, Base58
+from splurge_base58.__main__ import main as entry_point_main
+from splurge_base58.cli import main
 
 
-def run_cli_command(command: str, input_data: str) -> Tuple[int, str, str]:
+# Characters for generated round-trip inputs: printable ASCII without whitespace
+# (output is stripped) plus multi-byte UTF-8 characters
+_RANDOM_TEXT_ALPHABET = string.ascii_letters + string.digits + string.punctuation + "é你好世界🌍"
+
+
+def run_cli(argv: List[str]) -> Tuple[int, str, str]:
     """
-    Run a splurge_base58 CLI command and capture the output.
+    Run the splurge_base58 CLI in-process and capture the output.
     
     Args:
-        command: The CLI command to run ('encode' or 'decode')
-        input_data: The input data for the command
+        argv: Command-line arguments without the program name
+        
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            main(argv)
+        return_code = 0
+    except SystemExit as e:
+        return_code = e.code if isinstance(e.code, int) else 1
+    return return_code, stdout.getvalue().strip(), stderr.getvalue().strip()
+
+
+def run_module(argv: List[str], input_data: str = "") -> Tuple[int, str, str]:
+    """
+    Run ``python -m splurge_base58`` in a subprocess and capture the output.
+    
+    Args:
+        argv: Command-line arguments without the program name
+        input_data: Text to send to the process on stdin
         
     Returns:
         Tuple of (return_code, stdout, stderr)
     """
     try:
         result = subprocess.run(
-            [sys.executable, '-m', 'splurge_base58', command, input_data],
-            capture_output=True,
-            text=True,
+            [sys.executable, '-m', 'splurge_base58', *argv],
+            input=input_data.encode('utf-8'),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=30
         )
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
     except subprocess.TimeoutExpired:
-        return 1, "", "Command timed out"
-    except Exception as e:
-        return 1, "", str(e)
+        pytest.fail("Command timed out")
+    stdout = result.stdout.decode('utf-8', errors='surrogateescape')
+    stderr = result.stderr.decode('utf-8', errors='surrogateescape')
+    return result.returncode, stdout.strip(), stderr.strip()
+
+
+def run_cli_command(command: str, input_data: str) -> Tuple[int, str, str]:
+    """
+    Run a splurge_base58 CLI command and capture the output.
+    
+    Args:
+        command: The CLI command to run ('encode' or 'decode')
+        input_data: The input data for the command
+        
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    return run_cli([command, input_data])
+
+
+@lru_cache(maxsize=None)
+def encode_text(text: str) -> str:
+    """
+    Base-58 encode the UTF-8 bytes of a string, memoized across tests.
+    
+    Decode tests use this to build their input without a CLI encode pass.
+    
+    Args:
+        text: String to encode
+        
+    Returns:
+        Base-58 encoded string
+    """
+    return Base58.encode(text.encode('utf-8'))
 
 
 class TestCLIEncode:
     """Test CLI encode functionality."""
     
-    def test_encode_simple_string(self):
-        """Test encoding a simple string via CLI."""
-        test_input = "Hello, World!"
+    @pytest.mark.parametrize("test_input", [
+        "Hello, World!",
+        "你好世界",
+        "Special chars: !@#$%^&*()",
+        "1234567890",
+        "A",
+        "aaa" * 100,
+    ], ids=["simple", "unicode", "special", "numeric", "single", "repeated"])
+    def test_encode_string(self, test_input):
+        """Test encoding strings via CLI."""
         return_code, stdout, stderr = run_cli_command('encode', test_input)
         
         assert return_code == 0
@@ -67,69 +140,32 @@ class TestCLIEncode:
         assert "Error:" in stdout
         assert stderr == ""
     
-    def test_encode_unicode_string(self):
-        """Test encoding unicode string via CLI."""
-        test_input = "你好世界"
-        return_code, stdout, stderr = run_cli_command('encode', test_input)
-        
-        assert return_code == 0
-        assert stderr == ""
-        assert Base58.is_valid(stdout)
-        
-        # Verify round-trip (may fail in some environments due to console encoding)
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        if decoded_return_code == 0:
-            assert decoded_stdout == test_input
-        else:
-            # If decode fails due to console encoding, that's acceptable
-            # Just verify that the encoded string is valid base58
-            assert Base58.is_valid(stdout)
-    
-    def test_encode_special_characters(self):
-        """Test encoding string with special characters via CLI."""
-        test_input = "Special chars: !@#$%^&*()"
-        return_code, stdout, stderr = run_cli_command('encode', test_input)
-        
-        assert return_code == 0
-        assert stderr == ""
-        assert Base58.is_valid(stdout)
-        
-        # Verify round-trip
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        assert decoded_return_code == 0
-        assert decoded_stdout == test_input
-    
-    def test_encode_numeric_string(self):
-        """Test encoding numeric string via CLI."""
-        test_input = "1234567890"
-        return_code, stdout, stderr = run_cli_command('encode', test_input)
+    def test_encode_from_stdin(self, monkeypatch):
+        """Test encoding input read from stdin via CLI."""
+        test_input = "Hello, World!"
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(test_input + "\n"))
+        return_code, stdout, stderr = run_cli_command('encode', '-')
         
         assert return_code == 0
         assert stderr == ""
-        assert Base58.is_valid(stdout)
-        
-        # Verify round-trip
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        assert decoded_return_code == 0
-        assert decoded_stdout == test_input
+        assert stdout == encode_text(test_input)
     
     def test_encode_maximum_length(self):
         """Test encoding maximum length string via CLI."""
-        max_length_string = "a" * 2048
+        max_length_string = "a" * MAX_ENCODE_INPUT_LENGTH
         return_code, stdout, stderr = run_cli_command('encode', max_length_string)
         
         assert return_code == 0
         assert stderr == ""
         assert Base58.is_valid(stdout)
         
-        # Verify round-trip
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        assert decoded_return_code == 0
-        assert decoded_stdout == max_length_string
+        # Verify the output with the library; CLI decode at this length is
+        # covered by test_decode_maximum_length
+        assert Base58.decode(stdout) == max_length_string.encode('utf-8')
     
     def test_encode_exceeds_maximum_length(self):
         """Test encoding string that exceeds maximum length via CLI."""
-        too_long_string = "a" * 2049
+        too_long_string = "a" * (MAX_ENCODE_INPUT_LENGTH + 1)
         return_code, stdout, stderr = run_cli_command('encode', too_long_string)
         
         assert return_code == 1
@@ -143,18 +179,55 @@ class TestCLIDecode:
     
     def test_decode_valid_base58(self):
         """Test decoding valid base58 string via CLI."""
-        # First encode a string
         test_input = "Hello, World!"
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
-        assert encode_return_code == 0
+        encoded = encode_text(test_input)
         
-        # Then decode it
+        # Decode it
         decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
         
         assert decode_return_code == 0
         assert decode_stderr == ""
         assert decoded == test_input
     
+    def test_decode_from_stdin(self, monkeypatch):
+        """Test decoding input read from stdin via CLI."""
+        test_input = "Hello, World!"
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(encode_text(test_input) + "\n"))
+        return_code, stdout, stderr = run_cli_command('decode', '-')
+        
+        assert return_code == 0
+        assert stderr == ""
+        assert stdout == test_input
+    
+    def test_decode_from_stdin_exceeds_maximum_length(self, monkeypatch):
+        """Test that oversize stdin input is rejected without reading all of it."""
+        stdin = io.StringIO("1" * (MAX_DECODE_INPUT_LENGTH * 10))
+        monkeypatch.setattr(sys, 'stdin', stdin)
+        return_code, stdout, stderr = run_cli_command('decode', '-')
+        
+        assert return_code == 1
+        assert "exceeds maximum" in stdout
+        assert stdin.tell() < MAX_DECODE_INPUT_LENGTH * 10
+    
+    def test_stdin_unavailable(self, monkeypatch):
+        """Test reading from stdin when no stdin is attached."""
+        monkeypatch.setattr(sys, 'stdin', None)
+        return_code, stdout, stderr = run_cli_command('decode', '-')
+        
+        assert return_code == 1
+        assert "Error:" in stdout
+        assert "Standard input" in stdout
+    
+    def test_stdin_and_stdout_unavailable(self, monkeypatch):
+        """Test reading from stdin when neither stdin nor stdout is attached."""
+        monkeypatch.setattr(sys, 'stdin', None)
+        monkeypatch.setattr(sys, 'stdout', None)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(['decode', '-'])
+        
+        assert exc_info.value.code == 1
+    
     def test_decode_known_base58_strings(self):
         """Test decoding known base58 strings via CLI."""
         test_cases = [
@@ -190,9 +263,8 @@ class TestCLIDecode:
     def test_decode_maximum_length(self):
         """Test decoding maximum length base58 string via CLI."""
         # Create maximum length input and encode it
-        max_length_string = "a" * 2048
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', max_length_string)
-        assert encode_return_code == 0
+        max_length_string = "a" * MAX_ENCODE_INPUT_LENGTH
+        encoded = encode_text(max_length_string)
         
         # Decode it
         decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
@@ -203,8 +275,8 @@ class TestCLIDecode:
     
     def test_decode_exceeds_maximum_length(self):
         """Test decoding base58 string that exceeds maximum length via CLI."""
-        # Create a very long base58 string
-        very_long_base58 = "1" * 3000  # Much longer than the calculated max
+        # Create a base58 string one character past the limit
+        very_long_base58 = "1" * (MAX_DECODE_INPUT_LENGTH + 1)
         return_code, stdout, stderr = run_cli_command('decode', very_long_base58)
         
         assert return_code == 1
@@ -217,34 +289,42 @@ class TestCLIErrorHandling:
     """Test CLI error handling."""
     
     def test_missing_arguments(self):
-        """Test CLI with missing arguments."""
+        """Test CLI with missing arguments via ``python -m``."""
         # Test with no arguments
-        try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'splurge_base58'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            assert result.returncode == 1
-            assert "Usage:" in result.stdout
-        except subprocess.TimeoutExpired:
-            pytest.fail("Command timed out")
+        return_code, stdout, stderr = run_module([])
+        
+        assert return_code == 1
+        assert "Usage:" in stdout
+    
+    @pytest.mark.parametrize("argv", [
+        [],
+        ['decode', 'invalid!@#'],
+        ['invalid', 'test'],
+    ], ids=["usage", "decode_error", "unknown_command"])
+    def test_error_exit_without_stdout(self, monkeypatch, argv):
+        """Test that error paths still exit with status 1 when stdout is None."""
+        monkeypatch.setattr(sys, 'stdout', None)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        
+        assert exc_info.value.code == 1
     
     def test_insufficient_arguments(self):
         """Test CLI with insufficient arguments."""
         # Test with only command
-        try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'splurge_base58', 'encode'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            assert result.returncode == 1
-            assert "Usage:" in result.stdout
-        except subprocess.TimeoutExpired:
-            pytest.fail("Command timed out")
+        return_code, stdout, stderr = run_cli(['encode'])
+        
+        assert return_code == 1
+        assert "Usage:" in stdout
+    
+    def test_mixed_case_command(self):
+        """Test that command names are matched case-insensitively."""
+        return_code, stdout, stderr = run_cli(['ENCODE', 'Hello'])
+        
+        assert return_code == 0
+        assert stderr == ""
+        assert (return_code, stdout, stderr) == run_cli(['encode', 'Hello'])
     
     def test_unknown_command(self):
         """Test CLI with unknown command."""
@@ -268,10 +348,15 @@ class TestCLIErrorHandling:
 class TestCLIRoundTrip:
     """Test CLI round-trip functionality."""
     
-    def test_round_trip_simple_string(self):
+    @pytest.mark.parametrize("test_input", [
+        "Hello, World!",
+        "你好世界",
+        "Special chars: !@#$%^&*()_+-=[]{}|;':\",./<>?",
+        "1234567890",
+        "This is a longer string that will test the CLI's ability to handle larger inputs." * 10,
+    ], ids=["simple", "unicode", "special", "numeric", "long"])
+    def test_round_trip(self, test_input):
         """Test round-trip encoding and decoding via CLI."""
-        test_input = "Hello, World!"
-        
         # Encode
         encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
         assert encode_return_code == 0
@@ -285,101 +370,68 @@ class TestCLIRoundTrip:
         # Verify round-trip
         assert decoded == test_input
     
-    def test_round_trip_unicode_string(self):
-        """Test round-trip encoding and decoding unicode via CLI."""
-        test_input = "你好世界"
+    def test_round_trip_via_module_stdin(self):
+        """Test round-trip through ``python -m`` with input piped on stdin."""
+        test_input = "你好世界 🌍"
         
-        # Encode
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
-        assert encode_return_code == 0
-        
-        # Decode
-        decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
-        if decode_return_code == 0:
-            # Verify round-trip
-            assert decoded == test_input
-        else:
-            # If decode fails due to console encoding, that's acceptable
-            # Just verify that the encoded string is valid base58
-            assert Base58.is_valid(encoded)
-    
-    def test_round_trip_special_characters(self):
-        """Test round-trip encoding and decoding special characters via CLI."""
-        test_input = "Special chars: !@#$%^&*()_+-=[]{}|;':\",./<>?"
-        
-        # Encode
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
+        encode_return_code, encoded, encode_stderr = run_module(['encode', '-'], test_input + "\n")
         assert encode_return_code == 0
+        assert encode_stderr == ""
         
-        # Decode
-        decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
+        decode_return_code, decoded, decode_stderr = run_module(['decode', '-'], encoded + "\n")
         assert decode_return_code == 0
-        
-        # Verify round-trip
+        assert decode_stderr == ""
         assert decoded == test_input
     
-    def test_round_trip_numeric_string(self):
-        """Test round-trip encoding and decoding numeric string via CLI."""
-        test_input = "1234567890"
-        
-        # Encode
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
-        assert encode_return_code == 0
-        
-        # Decode
-        decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
-        assert decode_return_code == 0
-        
-        # Verify round-trip
-        assert decoded == test_input
+    @pytest.mark.parametrize("argv", [
+        ['encode', 'hi'],
+        ['decode', '8wr'],
+    ], ids=["encode", "decode"])
+    def test_success_without_stdout(self, monkeypatch, argv):
+        """Test that commands still exit with status 0 when stdout is None."""
+        monkeypatch.setattr(sys, 'stdout', None)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        
+        assert exc_info.value.code == 0
     
-    def test_round_trip_long_string(self):
-        """Test round-trip encoding and decoding long string via CLI."""
-        test_input = "This is a longer string that will test the CLI's ability to handle larger inputs." * 10
-        
-        # Encode
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
-        assert encode_return_code == 0
-        
-        # Decode
-        decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
-        assert decode_return_code == 0
-        
-        # Verify round-trip
-        assert decoded == test_input
+    def test_entry_point_uses_utf8_stdio(self, monkeypatch):
+        """Test that the console entry point reads stdin as UTF-8 regardless of locale."""
+        test_input = "你好世界 🌍"
+        # Start from a non-UTF-8 encoding, as on a legacy console code page
+        stdin = io.TextIOWrapper(io.BytesIO((test_input + "\n").encode('utf-8')), encoding='latin-1')
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='latin-1')
+        monkeypatch.setattr(sys, 'argv', ['splurge-base58', 'encode', '-'])
+        monkeypatch.setattr(sys, 'stdin', stdin)
+        monkeypatch.setattr(sys, 'stdout', stdout)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            entry_point_main()
+        
+        assert exc_info.value.code == 0
+        stdout.flush()
+        assert stdout.buffer.getvalue().strip().decode('ascii') == encode_text(test_input)
+    
+    def test_round_trip_random_strings(self):
+        """Test round-trip encoding and decoding random strings via CLI."""
+        rng = random.Random(58)
+        for _ in range(15):
+            # Keep the UTF-8 form within the encode limit even for 4-byte characters
+            length = rng.randint(1, MAX_ENCODE_INPUT_LENGTH // 4)
+            test_input = "".join(rng.choice(_RANDOM_TEXT_ALPHABET) for _ in range(length))
+            
+            encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
+            assert encode_return_code == 0
+            
+            decode_return_code, decoded, decode_stderr = run_cli_command('decode', encoded)
+            assert decode_return_code == 0
+            assert decoded == test_input
 
 
 class TestCLIEdgeCases:
     """Test CLI edge cases."""
     
-    def test_encode_single_character(self):
-        """Test encoding single character via CLI."""
-        test_input = "A"
-        return_code, stdout, stderr = run_cli_command('encode', test_input)
-        
-        assert return_code == 0
-        assert stderr == ""
-        assert Base58.is_valid(stdout)
-        
-        # Verify round-trip
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        assert decoded_return_code == 0
-        assert decoded_stdout == test_input
-    
-    def test_encode_repeated_characters(self):
-        """Test encoding string with repeated characters via CLI."""
-        test_input = "aaa" * 100
-        return_code, stdout, stderr = run_cli_command('encode', test_input)
-        
-        assert return_code == 0
-        assert stderr == ""
-        assert Base58.is_valid(stdout)
-        
-        # Verify round-trip
-        decoded_return_code, decoded_stdout, decoded_stderr = run_cli_command('decode', stdout)
-        assert decoded_return_code == 0
-        assert decoded_stdout == test_input
-    
     def test_decode_all_ones(self):
         """Test decoding base58 string of all ones via CLI."""
         all_ones = "11111111111111111111111111111111"
@@ -396,14 +448,10 @@ class TestCLIEdgeCases:
         bitcoin_address = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
         return_code, stdout, stderr = run_cli_command('decode', bitcoin_address)
         
-        # Bitcoin address format may not decode to valid UTF-8, which is acceptable
-        if return_code == 0:
-            assert stderr == ""
-            # Should decode to some binary data
-            assert len(stdout) > 0
-        else:
-            # If it fails due to UTF-8 decode issues, that's acceptable
-            assert "Error:" in stdout
+        # Decoded bytes are written as-is even though they are not valid UTF-8
+        assert return_code == 0
+        assert stderr == ""
+        assert stdout.encode('utf-8', 'surrogateescape') == Base58.decode(bitcoin_address)
 
 
 class TestCLIPerformance:
@@ -413,37 +461,32 @@ class TestCLIPerformance:
         """Test CLI encode performance with small input."""
         test_input = "Hello, World!"
         
-        import time
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         return_code, stdout, stderr = run_cli_command('encode', test_input)
-        end_time = time.time()
+        elapsed_ns = perf_counter_ns() - start_ns
         
         assert return_code == 0
-        assert end_time - start_time < 5.0  # Should complete within 5 seconds
+        assert elapsed_ns < 5_000_000_000  # Should complete within 5 seconds
     
     def test_decode_performance_small_input(self):
         """Test CLI decode performance with small input."""
-        # First encode to get a valid base58 string
-        test_input = "Hello, World!"
-        encode_return_code, encoded, encode_stderr = run_cli_command('encode', test_input)
-        assert encode_return_code == 0
+        # Get a valid base58 string to decode
+        encoded = encode_text("Hello, World!")
         
-        import time
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         return_code, stdout, stderr = run_cli_command('decode', encoded)
-        end_time = time.time()
+        elapsed_ns = perf_counter_ns() - start_ns
         
         assert return_code == 0
-        assert end_time - start_time < 5.0  # Should complete within 5 seconds
+        assert elapsed_ns < 5_000_000_000  # Should complete within 5 seconds
     
     def test_encode_performance_large_input(self):
         """Test CLI encode performance with large input."""
         test_input = "a" * 1000
         
-        import time
-        start_time = time.time()
+        start_ns = perf_counter_ns()
         return_code, stdout, stderr = run_cli_command('encode', test_input)
-        end_time = time.time()
+        elapsed_ns = perf_counter_ns() - start_ns
         
         assert return_code == 0
-        assert end_time - start_time < 10.0  # Should complete within 10 seconds
+        assert elapsed_ns < 10_000_000_000  # Should complete within 10 seconds